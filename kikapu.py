@@ -5,37 +5,180 @@ Script for generating investor-ready CPG business data
 
 import pandas as pd # type: ignore
 import numpy as np # type: ignore
-from datetime import datetime, timedelta
-import random
-from typing import List, Dict, Tuple, Any
+from datetime import datetime
+from typing import Dict, Tuple, Any, Optional
 import os
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    import pyarrow as pa # type: ignore
+    import pyarrow.parquet as pq # type: ignore
+except ImportError:  # Parquet output is optional
+    pa = None
+    pq = None
+
+try:
+    import polars as pl # type: ignore
+    import polars.selectors as cs # type: ignore
+except ImportError:  # Fall back to pandas' CSV writer
+    pl = None
+
+try:
+    import duckdb # type: ignore
+except ImportError:  # DuckDB output is optional
+    duckdb = None
+
+try:
+    from numba import njit, prange, set_num_threads # type: ignore
+except ImportError:  # Fall back to the NumPy implementation
+    njit = None
+
+# ============================================================================
+# NUMBA KERNELS
+_order_schedule_kernel = None
+_order_financials_kernel = None
+
+if njit is not None:
+    # Random draws stay on the seeded NumPy generator so runs remain reproducible
+    # regardless of thread count; kernels only fuse the arithmetic around them
+    @njit(parallel=True, cache=True)
+    def _order_schedule_kernel(acq_days, offsets, date_u, end_day, customer_idx, order_days):
+        """Fill each order's customer index and order day in one pass over customers"""
+        for c in prange(len(acq_days)):
+            window = max(min(end_day - acq_days[c], 730), 1)
+            for k in range(offsets[c], offsets[c + 1]):
+                customer_idx[k] = c
+                order_days[k] = acq_days[c] + np.int64(date_u[k] * window)
+    
+    # No fastmath: results must match the NumPy fallback bit for bit
+    @njit(parallel=True, cache=True)
+    def _order_financials_kernel(price_cents, cogs_cents, prod_idx, quantities, bounds, discount_percent,
+                                 line_subtotal, line_discount, line_revenue, line_cogs, line_profit,
+                                 order_subtotal, order_discount, order_revenue, order_cogs, order_profit):
+        """Fill line and order financials in one pass over each order's lines"""
+        for i in prange(len(bounds) - 1):
+            subtotal_cents = 0
+            total_cogs_cents = 0
+            for j in range(bounds[i], bounds[i + 1]):
+                line_subtotal_cents = price_cents[prod_idx[j]] * quantities[j]
+                line_cogs_cents = cogs_cents[prod_idx[j]] * quantities[j]
+                line_subtotal[j] = line_subtotal_cents / 100.0
+                line_cogs[j] = line_cogs_cents / 100.0
+                subtotal_cents += line_subtotal_cents
+                total_cogs_cents += line_cogs_cents
+            
+            subtotal = subtotal_cents / 100.0
+            total_cogs = total_cogs_cents / 100.0
+            discount_rate = discount_percent[i] / 100.0
+            discount_amount = subtotal * discount_rate
+            order_subtotal[i] = subtotal
+            order_discount[i] = discount_amount
+            order_revenue[i] = subtotal - discount_amount
+            order_cogs[i] = total_cogs
+            order_profit[i] = order_revenue[i] - total_cogs
+            
+            # Prorating the order discount by line subtotal is the order's discount rate
+            for j in range(bounds[i], bounds[i + 1]):
+                line_discount[j] = line_subtotal[j] * discount_rate
+                line_revenue[j] = line_subtotal[j] - line_discount[j]
+                line_profit[j] = line_revenue[j] - line_cogs[j]
+
 
 # ============================================================================
 # DATA GENERATION CLASS
 class KikapuDataGenerator:
     """Generate synthetic datasets for Kikapu Naturals CPG business"""
     
-    def __init__(self):
+    def __init__(self, seed: Optional[int] = None):
+        self.rng = np.random.default_rng(seed)
         self.products = None
         self.customers = None
         self.orders = None
         self.order_line_items = None
         
-    def weighted_random(self, weights: List[int]) -> int:
-        """Select index based on weighted probabilities"""
-        total = sum(weights)
-        rand = random.random() * total
-        for i, weight in enumerate(weights):
-            if rand < weight:
-                return i
-            rand -= weight
-        return len(weights) - 1
+    @staticmethod
+    def format_ids(prefix: str, numbers: np.ndarray, width: int) -> np.ndarray:
+        """Build zero-padded IDs (e.g. C000001) for an array of numbers"""
+        if numbers.size == 0:  # np.char.zfill fails on empty arrays
+            return np.array([], dtype=str)
+        return np.char.add(prefix, np.char.zfill(numbers.astype(str), width))
+    
+    @staticmethod
+    def order_schedule(acq_days: np.ndarray, offsets: np.ndarray, date_u: np.ndarray,
+                       end_day: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Map each order to its customer and place it within two years of acquisition"""
+        if _order_schedule_kernel is not None:
+            customer_idx = np.empty(len(date_u), dtype=np.int64)
+            order_days = np.empty(len(date_u), dtype=np.int64)
+            _order_schedule_kernel(acq_days, offsets, date_u, end_day, customer_idx, order_days)
+            return customer_idx, order_days
+        
+        customer_idx = np.repeat(np.arange(len(acq_days)), np.diff(offsets))
+        window = np.maximum(np.minimum(end_day - acq_days, 730), 1)
+        order_days = acq_days[customer_idx] + (date_u * window[customer_idx]).astype(np.int64)
+        return customer_idx, order_days
+    
+    @staticmethod
+    def order_financials(prices: np.ndarray, unit_cogs: np.ndarray, prod_idx: np.ndarray,
+                         quantities: np.ndarray, num_products: np.ndarray,
+                         discount_percent: np.ndarray) -> Dict[str, np.ndarray]:
+        """Compute line and order subtotal, discount, revenue, COGS and profit"""
+        n_lines = len(prod_idx)
+        n_orders = len(num_products)
+        bounds = np.concatenate(([0], np.cumsum(num_products)))
+        
+        # Sums run on integer cents so they are exact whatever the addition order,
+        # which keeps the numba kernel and the NumPy path identical
+        price_cents = np.round(prices * 100).astype(np.int64)
+        cogs_cents = np.round(unit_cogs * 100).astype(np.int64)
+        
+        if _order_financials_kernel is not None:
+            out = {name: np.empty(n_lines) for name in
+                   ['line_subtotal', 'line_discount', 'line_revenue', 'line_cogs', 'line_profit']}
+            out.update({name: np.empty(n_orders) for name in
+                        ['order_subtotal', 'order_discount', 'order_revenue', 'order_cogs', 'order_profit']})
+            _order_financials_kernel(price_cents, cogs_cents, prod_idx, quantities, bounds, discount_percent,
+                                     out['line_subtotal'], out['line_discount'], out['line_revenue'],
+                                     out['line_cogs'], out['line_profit'],
+                                     out['order_subtotal'], out['order_discount'], out['order_revenue'],
+                                     out['order_cogs'], out['order_profit'])
+            return out
+        
+        line_order_idx = np.repeat(np.arange(n_orders), num_products)
+        
+        # Price and COGS are gathered, multiplied and reduced together as two columns
+        line_values = np.column_stack((price_cents, cogs_cents))[prod_idx] * quantities[:, None]
+        line_subtotal, line_cogs = line_values[:, 0] / 100.0, line_values[:, 1] / 100.0
+        
+        # Calculate order totals
+        order_values = np.add.reduceat(line_values, bounds[:-1], axis=0)
+        order_subtotal, order_cogs = order_values[:, 0] / 100.0, order_values[:, 1] / 100.0
+        discount_rate = discount_percent / 100.0
+        order_discount = order_subtotal * discount_rate
+        order_revenue = order_subtotal - order_discount
+        
+        # Prorating the order discount by line subtotal is the order's discount rate
+        line_discount = line_subtotal * discount_rate[line_order_idx]
+        line_revenue = line_subtotal - line_discount
+        
+        return {
+            'line_subtotal': line_subtotal,
+            'line_discount': line_discount,
+            'line_revenue': line_revenue,
+            'line_cogs': line_cogs,
+            'line_profit': line_revenue - line_cogs,
+            'order_subtotal': order_subtotal,
+            'order_discount': order_discount,
+            'order_revenue': order_revenue,
+            'order_cogs': order_cogs,
+            'order_profit': order_revenue - order_cogs
+        }
     
-    def random_date(self, start_date: datetime, end_date: datetime) -> datetime:
-        """Generate random date between start and end"""
-        delta = end_date - start_date
-        random_days = random.random() * delta.days
-        return start_date + timedelta(days=random_days)
+    def random_dates(self, start_date: datetime, end_date: datetime, size: int) -> np.ndarray:
+        """Generate random dates between start and end"""
+        delta_days = (end_date - start_date).days
+        return np.datetime64(start_date, 'D') + self.rng.integers(0, delta_days, size=size).astype('timedelta64[D]')
     
     def generate_products(self) -> pd.DataFrame:
         """Generate product catalog (10 CPG products)"""
@@ -71,193 +214,225 @@ class KikapuDataGenerator:
         """Generate customer data with realistic attributes and data quality issues"""
         print(f"Generating {num_d2c} D2C customers...")
         
-        customers_data = []
+        segments = ['D2C', 'B2B']
         channels = ['Paid Ads', 'Organic Social', 'Email', 'Referral', 'SEO', 'Sales']
         countries = ['US', 'UK', 'CA', 'AU', 'DE'] # USA, UK, Canada, Australia, Germany
         statuses = ['Active', 'Churned', 'At Risk']
+        account_tiers = ['Enterprise', 'Mid-Market', 'SMB']
         
         start_date = datetime(2022, 1, 1)
         end_date = datetime(2024, 11, 30)
+        rng = self.rng
         
-        # Generate D2C customers
-        for i in range(1, num_d2c + 1):
-            if i % 10000 == 0:
-                print(f"  Generated {i}/{num_d2c} D2C customers...")
-            
-            acq_date = self.random_date(start_date, end_date)
-            days_since_acq = (end_date - acq_date).days
-            
-            # Realistic churn based on cohort age
-            if days_since_acq < 90:
-                status = statuses[self.weighted_random([80, 15, 5])]
-            elif days_since_acq < 365:
-                status = statuses[self.weighted_random([60, 30, 10])]
-            else:
-                status = statuses[self.weighted_random([40, 50, 10])]
-            
-            customer = {
-                'customer_id': f"C{i:06d}",
-                'segment': 'D2C',
-                'acquisition_date': acq_date.strftime('%Y-%m-%d'),
-                'channel': channels[self.weighted_random([30, 25, 15, 12, 15, 3])],
-                'country': countries[self.weighted_random([50, 20, 15, 10, 5])],
-                'status': status,
-                'company_name': None,
-                'account_tier': None
-            }
-            
-            # Introduce data quality issues
-            if random.random() < 0.02:  # 2% missing acquisition dates
-                customer['acquisition_date'] = None
-            if random.random() < 0.01:  # 1% missing channels
-                customer['channel'] = None
-            
-            customers_data.append(customer)
+        # Preallocate one array per column; categorical columns hold codes (-1 = missing)
+        n = num_d2c + num_b2b
+        d2c, b2b = slice(0, num_d2c), slice(num_d2c, n)
+        segment = np.empty(n, dtype=np.int8)
+        acquisition_date = np.empty(n, dtype='datetime64[D]')
+        channel = np.empty(n, dtype=np.int8)
+        country = np.empty(n, dtype=np.int8)
+        status = np.empty(n, dtype=np.int8)
+        company_name = np.full(n, None, dtype=object)
+        account_tier = np.full(n, -1, dtype=np.int8)
+        
+        # Generate D2C customers in a single vectorized pass
+        segment[d2c] = 0
+        acquisition_date[d2c] = self.random_dates(start_date, end_date, num_d2c)
+        days_since_acq = (np.datetime64(end_date, 'D') - acquisition_date[d2c]).astype(np.int64)
+        channel[d2c] = rng.choice(len(channels), size=num_d2c, p=np.array([30, 25, 15, 12, 15, 3]) / 100)
+        country[d2c] = rng.choice(len(countries), size=num_d2c, p=np.array([50, 20, 15, 10, 5]) / 100)
+        
+        # Realistic churn based on cohort age
+        regime = np.select([days_since_acq < 90, days_since_acq < 365], [0, 1], default=2)
+        d2c_status = status[d2c]
+        for r, weights in enumerate([[80, 15, 5], [60, 30, 10], [40, 50, 10]]):
+            mask = regime == r
+            d2c_status[mask] = rng.choice(len(statuses), size=int(mask.sum()), p=np.array(weights) / 100)
+        
+        # Introduce data quality issues
+        acquisition_date[d2c][rng.random(num_d2c) < 0.02] = np.datetime64('NaT')  # 2% missing acquisition dates
+        channel[d2c][rng.random(num_d2c) < 0.01] = -1                             # 1% missing channels
         
         # Generate B2B customers
         print(f"Generating {num_b2b} B2B customers...")
-        for i in range(1, num_b2b + 1):
-            acq_date = self.random_date(datetime(2021, 6, 1), end_date)
-            
-            customer = {
-                'customer_id': f"B{i:05d}",
-                'segment': 'B2B',
-                'acquisition_date': acq_date.strftime('%Y-%m-%d'),
-                'channel': 'Sales',
-                'country': countries[self.weighted_random([40, 30, 15, 10, 5])],
-                'status': 'Active',
-                'company_name': f"Business Customer {i}",
-                'account_tier': ['Enterprise', 'Mid-Market', 'SMB'][self.weighted_random([20, 50, 30])]
-            }
-            
-            customers_data.append(customer)
+        segment[b2b] = 1
+        channel[b2b] = channels.index('Sales')
+        status[b2b] = statuses.index('Active')
+        company_name[b2b] = np.char.add('Business Customer ', np.arange(1, num_b2b + 1).astype(str))
+        country[b2b] = rng.choice(len(countries), size=num_b2b, p=np.array([40, 30, 15, 10, 5]) / 100)
+        account_tier[b2b] = rng.choice(len(account_tiers), size=num_b2b, p=np.array([20, 50, 30]) / 100)
+        acquisition_date[b2b] = self.random_dates(datetime(2021, 6, 1), end_date, num_b2b)
+        
+        # IDs widen past their padding at scale, so they are concatenated rather than preallocated
+        customer_id = np.concatenate((self.format_ids('C', np.arange(1, num_d2c + 1), 6),
+                                      self.format_ids('B', np.arange(1, num_b2b + 1), 5)))
+        
+        self.customers = pd.DataFrame({
+            'customer_id': customer_id,
+            'segment': pd.Categorical.from_codes(segment, segments),
+            'acquisition_date': acquisition_date,
+            'channel': pd.Categorical.from_codes(channel, channels),
+            'country': pd.Categorical.from_codes(country, countries),
+            'status': pd.Categorical.from_codes(status, statuses),
+            'company_name': company_name,
+            'account_tier': pd.Categorical.from_codes(account_tier, account_tiers)
+        })
         
-        self.customers = pd.DataFrame(customers_data)
         print(f"Total customers generated: {len(self.customers)}")
         return self.customers
     
-    def generate_orders(self) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    def _sample_num_orders(self, customers: pd.DataFrame) -> np.ndarray:
+        """Determine number of orders based on segment and status"""
+        is_b2b = (customers['segment'] == 'B2B').to_numpy()
+        status = customers['status'].to_numpy()
+        
+        # B2B: 12-36, Active: 2-10, Churned: 1-3, At Risk: 2-7
+        low = np.where(is_b2b, 12, np.where(status == 'Active', 2, np.where(status == 'Churned', 1, 2)))
+        high = np.where(is_b2b, 36, np.where(status == 'Active', 10, np.where(status == 'Churned', 3, 7)))
+        return self.rng.integers(low, high + 1)
+    
+    def _generate_order_batch(self, customers: pd.DataFrame, first_order_id: int = 1,
+                              num_orders: Optional[np.ndarray] = None) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """Generate orders and line items for a batch of customers"""
+        assert self.products is not None
+        rng = self.rng
+        
+        end_date = np.datetime64('2024-11-30', 'D')
+        customer_ids = customers['customer_id'].to_numpy()
+        is_b2b = (customers['segment'] == 'B2B').to_numpy()
+        
+        # Parse acquisition dates (missing dates default to 2023-01-01); a fixed format and
+        # cache keep this a single C pass when customers are loaded from CSV as strings
+        acq_dates = (pd.to_datetime(customers['acquisition_date'], format='%Y-%m-%d', cache=True)
+                     .to_numpy().astype('datetime64[D]'))
+        acq_dates[np.isnat(acq_dates)] = np.datetime64('2023-01-01')
+        
+        if num_orders is None:
+            num_orders = self._sample_num_orders(customers)
+        
+        # Expand customers into one row per order and generate orders over time
+        offsets = np.concatenate(([0], np.cumsum(num_orders)))
+        n_orders = int(offsets[-1])
+        order_customer_idx, order_days = self.order_schedule(
+            acq_dates.astype(np.int64), offsets, rng.random(n_orders), end_date.astype(np.int64))
+        order_dates = order_days.astype('datetime64[D]')
+        order_customer_ids = customer_ids[order_customer_idx]
+        order_is_b2b = is_b2b[order_customer_idx]
+        
+        # Data quality issues
+        missing_order_date = rng.random(n_orders) < 0.005  # 0.5% missing order dates
+        missing_cogs = rng.random(n_orders) < 0.03         # 3% missing COGS
+        
+        # Product catalog as arrays for fancy indexing
+        product_ids = self.products['product_id'].to_numpy()
+        product_names = self.products['name'].to_numpy()
+        category_codes, category_names = pd.factorize(self.products['category'])
+        prices = self.products['unit_price'].to_numpy()
+        unit_cogs = self.products['avg_cogs'].to_numpy()
+        
+        # Products per order (B2B: 3-8, D2C: 1-3)
+        num_products = np.where(order_is_b2b,
+                                rng.integers(3, 9, size=n_orders),
+                                rng.integers(1, 4, size=n_orders)).astype(np.int8)
+        
+        # Expand orders into one row per line item and select random products
+        line_order_idx = np.repeat(np.arange(n_orders), num_products)
+        n_lines = len(line_order_idx)
+        boundaries = np.concatenate(([0], np.cumsum(num_products)[:-1]))
+        prod_idx = rng.integers(0, len(self.products), size=n_lines)
+        quantities = np.where(order_is_b2b[line_order_idx],
+                              rng.integers(10, 61, size=n_lines),
+                              rng.integers(1, 4, size=n_lines)).astype(np.int16)
+        
+        # Discount logic
+        discount_percent = np.where(order_is_b2b,
+                                    rng.choice([0, 5, 10, 15, 20], size=n_orders,
+                                               p=np.array([20, 30, 30, 15, 5]) / 100),
+                                    rng.choice([0, 10, 15], size=n_orders,
+                                               p=np.array([70, 25, 5]) / 100)).astype(np.int8)
+        
+        # Calculate line and order totals
+        fin = self.order_financials(prices, unit_cogs, prod_idx, quantities, num_products, discount_percent)
+        
+        # Round money columns to cents in place
+        for values in fin.values():
+            np.round(values, 2, out=values)
+        
+        order_numbers = np.arange(first_order_id, first_order_id + n_orders)
+        order_ids = self.format_ids('ORD', order_numbers, 7)
+        order_date_col = np.where(missing_order_date, np.datetime64('NaT'), order_dates)
+        
+        orders = pd.DataFrame({
+            'order_id': order_ids,
+            'customer_id': order_customer_ids,
+            'order_date': order_date_col,
+            'subtotal': fin['order_subtotal'],
+            'discount_percent': discount_percent,
+            'discount_amount': fin['order_discount'],
+            'revenue': fin['order_revenue'],
+            'total_cogs': np.where(missing_cogs, np.nan, fin['order_cogs']),
+            'profit': np.where(missing_cogs, np.nan, fin['order_profit']),
+            'num_items': num_products
+        })
+        
+        # Create line items
+        item_idx = np.arange(n_lines) - boundaries[line_order_idx] + 1
+        line_item_ids = np.char.add(np.char.add(self.format_ids('LI', order_numbers[line_order_idx], 7), '_'),
+                                    item_idx.astype(str))
+        
+        line_items = pd.DataFrame({
+            'line_item_id': line_item_ids,
+            'order_id': order_ids[line_order_idx],
+            'customer_id': order_customer_ids[line_order_idx],
+            'product_id': pd.Categorical.from_codes(prod_idx, product_ids),
+            'product_name': pd.Categorical.from_codes(prod_idx, product_names),
+            'category': pd.Categorical.from_codes(category_codes[prod_idx], category_names),
+            'quantity': quantities,
+            'unit_price': prices[prod_idx],
+            'subtotal': fin['line_subtotal'],
+            'discount_amount': fin['line_discount'],
+            'revenue': fin['line_revenue'],
+            'cogs': fin['line_cogs'],
+            'profit': fin['line_profit'],
+            'order_date': order_date_col[line_order_idx]
+        })
+        
+        return orders, line_items
+    
+    def generate_orders(self, workers: int = 1) -> Tuple[pd.DataFrame, pd.DataFrame]:
         """Generate orders and line items with realistic transaction patterns"""
         print("Generating orders and line items...")
         
         if self.customers is None or self.products is None:
             raise ValueError("Must generate customers and products first")
         
-        orders_data = []
-        line_items_data = []
-        order_id = 1
-        
-        end_date = datetime(2024, 11, 30)
-        
-        for i, (idx, customer) in enumerate(self.customers.iterrows()):
-            if i % 5000 == 0:
-                print(f"  Processing customer {i}/{len(self.customers)}...")
+        if workers <= 1 or len(self.customers) <= 1:
+            self.orders, self.order_line_items = self._generate_order_batch(self.customers)
+        else:
+            # Order counts are drawn up front so each chunk knows its first order number
+            num_orders = self._sample_num_orders(self.customers)
+            chunks = np.array_split(np.arange(len(self.customers)), min(workers, len(self.customers)))
+            first_order_ids = np.cumsum([1] + [num_orders[c].sum() for c in chunks[:-1]])
             
-            is_b2b = customer['segment'] == 'B2B'
+            # Each chunk gets an independent child RNG stream
+            chunk_generators = []
+            for child_rng in self.rng.spawn(len(chunks)):
+                chunk_generator = KikapuDataGenerator()
+                chunk_generator.rng = child_rng
+                chunk_generator.products = self.products
+                chunk_generators.append(chunk_generator)
             
-            # Parse acquisition date
-            if pd.isna(customer['acquisition_date']):
-                acq_date = datetime(2023, 1, 1)
-            else:
-                acq_date = datetime.strptime(customer['acquisition_date'], '%Y-%m-%d')
-            
-            # Determine number of orders based on segment and status
-            if is_b2b:
-                num_orders = random.randint(12, 36)  # B2B: 12-36 orders
-            else:
-                if customer['status'] == 'Active':
-                    num_orders = random.randint(2, 10)  # 2-10 orders
-                elif customer['status'] == 'Churned':
-                    num_orders = random.randint(1, 3)   # 1-3 orders
-                else:
-                    num_orders = random.randint(2, 7)   # 2-7 orders
+            # Spawn rather than fork: numba's threading layers are not fork-safe once a
+            # kernel has run in this process
+            with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn'),
+                                     initializer=_init_order_worker) as executor:
+                batches = list(executor.map(_generate_order_chunk, chunk_generators,
+                                            [self.customers.iloc[c] for c in chunks],
+                                            [num_orders[c] for c in chunks],
+                                            [int(i) for i in first_order_ids]))
             
-            # Generate orders over time
-            for _ in range(num_orders):
-                days_since_acq = (end_date - acq_date).days
-                order_date = self.random_date(acq_date, 
-                                             acq_date + timedelta(days=min(days_since_acq, 730)))
-                
-                # Products per order
-                num_products = random.randint(3, 8) if is_b2b else random.randint(1, 3)
-                
-                # Select random products
-                selected_products = []
-                for _ in range(num_products):
-                    product = self.products.iloc[random.randint(0, len(self.products) - 1)]
-                    quantity = random.randint(10, 60) if is_b2b else random.randint(1, 3)
-                    selected_products.append({'product': product, 'quantity': quantity})
-                
-                # Calculate order totals
-                subtotal = sum(item['product']['unit_price'] * item['quantity'] 
-                             for item in selected_products)
-                
-                # Discount logic
-                if is_b2b:
-                    discount_percent = [0, 5, 10, 15, 20][self.weighted_random([20, 30, 30, 15, 5])]
-                else:
-                    discount_percent = [0, 10, 15][self.weighted_random([70, 25, 5])]
-                
-                discount_amount = subtotal * (discount_percent / 100)
-                revenue = subtotal - discount_amount
-                total_cogs = sum(item['product']['avg_cogs'] * item['quantity'] 
-                               for item in selected_products)
-                profit = revenue - total_cogs
-                
-                # Create order record
-                order = {
-                    'order_id': f"ORD{order_id:07d}",
-                    'customer_id': customer['customer_id'],
-                    'order_date': order_date.strftime('%Y-%m-%d'),
-                    'subtotal': round(subtotal, 2),
-                    'discount_percent': discount_percent,
-                    'discount_amount': round(discount_amount, 2),
-                    'revenue': round(revenue, 2),
-                    'total_cogs': round(total_cogs, 2),
-                    'profit': round(profit, 2),
-                    'num_items': len(selected_products)
-                }
-                
-                # Data quality issues
-                if random.random() < 0.005:  # 0.5% missing order dates
-                    order['order_date'] = None
-                if random.random() < 0.03:   # 3% missing COGS
-                    order['total_cogs'] = None
-                    order['profit'] = None
-                
-                orders_data.append(order)
-                
-                # Create line items
-                for item_idx, item in enumerate(selected_products, 1):
-                    item_subtotal = item['product']['unit_price'] * item['quantity']
-                    item_discount = (item_subtotal / subtotal) * discount_amount
-                    item_revenue = item_subtotal - item_discount
-                    item_cogs = item['product']['avg_cogs'] * item['quantity']
-                    item_profit = item_revenue - item_cogs
-                    
-                    line_item = {
-                        'line_item_id': f"LI{order_id:07d}_{item_idx}",
-                        'order_id': order['order_id'],
-                        'customer_id': customer['customer_id'],
-                        'product_id': item['product']['product_id'],
-                        'product_name': item['product']['name'],
-                        'category': item['product']['category'],
-                        'quantity': item['quantity'],
-                        'unit_price': item['product']['unit_price'],
-                        'subtotal': round(item_subtotal, 2),
-                        'discount_amount': round(item_discount, 2),
-                        'revenue': round(item_revenue, 2),
-                        'cogs': round(item_cogs, 2),
-                        'profit': round(item_profit, 2),
-                        'order_date': order['order_date']
-                    }
-                    
-                    line_items_data.append(line_item)
-                
-                order_id += 1
-        
-        self.orders = pd.DataFrame(orders_data)
-        self.order_line_items = pd.DataFrame(line_items_data)
+            self.orders = pd.concat([orders for orders, _ in batches], ignore_index=True)
+            self.order_line_items = pd.concat([line_items for _, line_items in batches], ignore_index=True)
         
         print(f"Total orders generated: {len(self.orders)}")
         print(f"Total line items generated: {len(self.order_line_items)}")
@@ -315,9 +490,8 @@ class KikapuDataGenerator:
             'stats': stats
         }
     
-    def save_to_csv(self, output_dir: str = './kikapu_data'):
-        """Save all datasets to CSV files"""
-        # Ensure datasets are generated before attempting to save
+    def _ensure_generated(self):
+        """Generate all datasets if any are missing"""
         if self.products is None or self.customers is None or self.orders is None or self.order_line_items is None:
             print("One or more datasets are missing; generating all datasets now...")
             # This will populate products, customers, orders, and order_line_items
@@ -326,25 +500,140 @@ class KikapuDataGenerator:
         # Make sure static type checkers know these are not None at this point
         assert self.products is not None and self.customers is not None and self.orders is not None and self.order_line_items is not None, "Datasets must be generated before saving"
 
+    def _datasets(self) -> Dict[str, pd.DataFrame]:
+        """Map output file stems to datasets"""
+        return {
+            'kikapu_products': self.products,
+            'kikapu_customers': self.customers,
+            'kikapu_orders': self.orders,
+            'kikapu_order_line_items': self.order_line_items
+        }
+    
+    def save_to_csv(self, output_dir: str = './kikapu_data'):
+        """Save all datasets to CSV files"""
+        # Ensure datasets are generated before attempting to save
+        self._ensure_generated()
+
         if not os.path.exists(output_dir):
             os.makedirs(output_dir)
         
         print(f"\nSaving datasets to {output_dir}/...")
         
-        self.products.to_csv(f"{output_dir}/kikapu_products.csv", index=False)
-        print(f"  ✓ Saved kikapu_products.csv")
+        for name, df in self._datasets().items():
+            if pl is not None:
+                # polars' multi-threaded writer; dates are cast so they still print as YYYY-MM-DD
+                pl.from_pandas(df).with_columns(cs.datetime().cast(pl.Date)).write_csv(f"{output_dir}/{name}.csv")
+            else:
+                df.to_csv(f"{output_dir}/{name}.csv", index=False)
+            print(f"  ✓ Saved {name}.csv")
+
+        print(f"\nAll files saved to {output_dir}/")
+    
+    def save_to_parquet(self, output_dir: str = './kikapu_data', compression: str = 'zstd'):
+        """Save all datasets to Parquet files (requires pyarrow)"""
+        if pq is None:
+            raise ImportError("pyarrow is required to save Parquet files: pip install pyarrow")
+
+        # Ensure datasets are generated before attempting to save
+        self._ensure_generated()
+
+        if not os.path.exists(output_dir):
+            os.makedirs(output_dir)
         
-        self.customers.to_csv(f"{output_dir}/kikapu_customers.csv", index=False)
-        print(f"  ✓ Saved kikapu_customers.csv")
+        print(f"\nSaving datasets to {output_dir}/...")
         
-        self.orders.to_csv(f"{output_dir}/kikapu_orders.csv", index=False)
-        print(f"  ✓ Saved kikapu_orders.csv")
-
-        self.order_line_items.to_csv(f"{output_dir}/kikapu_order_line_items.csv", index=False)
-        print(f"  ✓ Saved kikapu_order_line_items.csv")
+        for name, df in self._datasets().items():
+            self._write_parquet(df, f"{output_dir}/{name}.parquet", compression)
+            print(f"  ✓ Saved {name}.parquet")
 
         print(f"\nAll files saved to {output_dir}/")
     
+    @staticmethod
+    def _write_parquet(df: pd.DataFrame, path: str, compression: str):
+        """Write one dataset to a Parquet file"""
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        pq.write_table(table, path, compression=compression, use_dictionary=True)
+    
+    def save_to_duckdb(self, path: str = './kikapu_data/kikapu.duckdb'):
+        """Save all datasets as tables in a DuckDB database (requires duckdb and pyarrow)"""
+        if duckdb is None or pa is None:
+            raise ImportError("duckdb and pyarrow are required to save to DuckDB: pip install duckdb pyarrow")
+
+        # Ensure datasets are generated before attempting to save
+        self._ensure_generated()
+
+        output_dir = os.path.dirname(path)
+        if output_dir and not os.path.exists(output_dir):
+            os.makedirs(output_dir)
+        
+        print(f"\nSaving datasets to {path}...")
+        
+        con = duckdb.connect(path)
+        try:
+            for name, df in self._datasets().items():
+                table = name.replace('kikapu_', '', 1)
+                # Arrow tables are scanned zero-copy; no Python rows cross into DuckDB
+                con.register('arrow_tbl', pa.Table.from_pandas(df, preserve_index=False))
+                con.execute(f"CREATE OR REPLACE TABLE {table} AS SELECT * FROM arrow_tbl")
+                con.unregister('arrow_tbl')
+                print(f"  ✓ Saved table {table}")
+        finally:
+            con.close()
+
+        print(f"\nAll tables saved to {path}")
+    
+    def stream_orders_to_parquet(self, output_dir: str = './kikapu_data', batch_size: int = 1000,
+                                 compression: str = 'zstd') -> Tuple[int, int]:
+        """Save all datasets to Parquet, streaming orders and line items in customer batches"""
+        # Unlike generate_orders, the full order tables are never held in memory, so
+        # self.orders and self.order_line_items are left untouched. Products and customers
+        # are written here too, since save_to_parquet would regenerate everything
+        if pq is None:
+            raise ImportError("pyarrow is required to save Parquet files: pip install pyarrow")
+        
+        if self.customers is None or self.products is None:
+            raise ValueError("Must generate customers and products first")
+
+        if not os.path.exists(output_dir):
+            os.makedirs(output_dir)
+        
+        print(f"\nSaving datasets to {output_dir}/...")
+        
+        for name, df in [('kikapu_products', self.products), ('kikapu_customers', self.customers)]:
+            self._write_parquet(df, f"{output_dir}/{name}.parquet", compression)
+            print(f"  ✓ Saved {name}.parquet")
+        
+        print("Streaming orders and line items...")
+        
+        writers: Dict[str, Any] = {}
+        total_orders = 0
+        total_line_items = 0
+        try:
+            for start in range(0, len(self.customers), batch_size):
+                if start % (batch_size * 10) == 0:
+                    print(f"  Processing customer {start}/{len(self.customers)}...")
+                
+                orders, line_items = self._generate_order_batch(
+                    self.customers.iloc[start:start + batch_size], first_order_id=total_orders + 1)
+                
+                for name, df in [('kikapu_orders', orders), ('kikapu_order_line_items', line_items)]:
+                    table = pa.Table.from_pandas(df, preserve_index=False)
+                    if name not in writers:
+                        writers[name] = pq.ParquetWriter(f"{output_dir}/{name}.parquet", table.schema,
+                                                         compression=compression, use_dictionary=True)
+                    writers[name].write_table(table)
+                
+                total_orders += len(orders)
+                total_line_items += len(line_items)
+        finally:
+            for writer in writers.values():
+                writer.close()
+        
+        print(f"Total orders generated: {total_orders}")
+        print(f"Total line items generated: {total_line_items}")
+        
+        return total_orders, total_line_items
+    
     def get_data_quality_report(self) -> str:
         """Generate data quality report"""
         if self.customers is None or self.orders is None:
@@ -381,16 +670,25 @@ class KikapuDataGenerator:
         return report
 
 
+def _init_order_worker():
+    """Keep numba kernels single-threaded in workers; the pool already uses the cores"""
+    if njit is not None:
+        set_num_threads(1)
+
+
+def _generate_order_chunk(generator: KikapuDataGenerator, customers: pd.DataFrame,
+                          num_orders: np.ndarray, first_order_id: int) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """Worker entry point for parallel order generation"""
+    return generator._generate_order_batch(customers, first_order_id, num_orders)
+
+
 # ============================================================================
 # USAGE EXAMPLE
 # ============================================================================
 
 if __name__ == "__main__":
-    # Setting random seed for reproducibility
-    random.seed(42)
-    
-    # Initialize generator
-    generator = KikapuDataGenerator()
+    # Initialize generator (seeded for reproducibility)
+    generator = KikapuDataGenerator(seed=42)
     
     # Generate all datasets
     datasets = generator.generate_all()